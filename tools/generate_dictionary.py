@@ -24,12 +24,22 @@ Usage:
 
     # Verbose output
     python generate_dictionary.py -v
+
+Extracted word vectors and pole centroids are cached under tools/.cache/
+(keyed by model name + installed version and poles config), so re-runs
+and --extend only send new words through spaCy. Pass --no-cache to
+bypass it.
 """
 
 import argparse
+import functools
+import hashlib
+import importlib.metadata
+import itertools
 import json
 import sys
 import os
+import tempfile
 import time
 from pathlib import Path
 
@@ -42,6 +52,19 @@ except ImportError:
     print("   Then download model: python -m spacy download es_core_news_lg")
     sys.exit(1)
 
+# Optional: SIMD cosine kernels for the word × pole scoring step.
+# Falls back to a NumPy matmul when not installed.
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+# Optional: faster JSON serialization for the output files.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ─────────────────────────────────────────────
 # Constants
@@ -51,12 +74,22 @@ SCRIPT_DIR = Path(__file__).parent
 DEFAULT_POLES_PATH = SCRIPT_DIR / "semantic_poles.json"
 DEFAULT_OUTPUT_PATH = SCRIPT_DIR.parent / "data" / "semantic_dict.json"
 DEFAULT_WORDLIST_PATH = SCRIPT_DIR / "wordlist_es.txt"
+DEFAULT_CACHE_DIR = SCRIPT_DIR / ".cache"
+CACHE_VERSION = 2
+
+# Only static word vectors are used, so every trainable pipeline component
+# is dead weight: excluding them skips per-doc processing and their memory.
+UNUSED_PIPES = ["tok2vec", "morphologizer", "tagger", "parser", "senter",
+                "attribute_ruler", "lemmatizer", "ner"]
+PIPE_BATCH_SIZE = 1000
+VECTOR_STORE_CHUNK = 4096  # rows added each time the vector store grows
+VECTOR_LRU_SIZE = 10_000  # single-word lookups kept outside the store
 
 # A rich curated word list. These are words likely to be typed by a
 # Spanish-speaking user in a poetic/contemplative context, plus common
 # everyday words. The generator processes them through spaCy's pipeline
 # to get vectors even for words not in the model's base vocab.
-CURATED_WORDS = """
+_CURATED_TEXT = """
 agua lluvia mar océano río lago gota charco inundación cascada arroyo manantial
 rocío humedad vapor niebla llovizna torrente marea ola naufragio sumergir ahogar
 sed playa costa profundidad corriente caudal estanque acequia riachuelo diluvio
@@ -107,7 +140,33 @@ viejo nuevo antiguo moderno joven gastado roto usado desgastado frágil
 bello feo hermoso horrible sublime terrible magnífico miserable
 silencio ruido sonido murmullo susurro grito canto melodía ritmo eco
 música nota acorde disonancia armonía vibración resonancia frecuencia tono
-""".split()
+"""
+
+# Normalized once at import rather than on every generate_dictionary() call.
+CURATED_WORDS = frozenset(w.lower() for w in _CURATED_TEXT.split() if len(w) >= 2)
+
+
+# ─────────────────────────────────────────────
+# Helpers
+# ─────────────────────────────────────────────
+
+def write_json(path, data):
+    """Write `data` as 2-space indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+# Scoring backends in order of preference; the first one is used by default.
+SCORING_BACKENDS = [
+    name for name, available in (
+        ("simsimd", simsimd is not None),
+        ("numpy", True),
+    ) if available
+]
 
 
 # ─────────────────────────────────────────────
@@ -120,21 +179,38 @@ class SemanticPoleEngine:
     to predefined semantic poles using word embeddings.
     """
 
-    def __init__(self, model_name="es_core_news_lg", verbose=False):
+    def __init__(self, model_name="es_core_news_lg", verbose=False, cache_dir=None):
         self.verbose = verbose
         self.nlp = None
         self.model_name = model_name
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.poles = {}
         self.special_words = {}
         self.config = {}
         self.pole_vectors = {}  # centroid vector for each pole
-        self._vector_cache = {}
+        self._pole_names = []
+        self._pole_matrix = None  # (P, D) stacked centroids, same order as _pole_names
+        self._param_names = []
+        # (P, K) pole → parameter weights; kept float64 like the (N, K) effects
+        # it produces, so rounded output values serialize without float32 noise
+        self._affects_matrix = None
+        self._affects_columns = []  # per pole: effect columns in its "affects" order
+        self._inv_span = 1.0  # 1 / (1 - similarity_threshold)
+        # Word vectors live as L2-normalized rows of one float32 array, with
+        # their original norms alongside; the index maps each word to its row,
+        # or -1 if the model has no vector for it.
+        self._vector_index = {}
+        self._vector_store = None
+        self._vector_norms = None
+        self._vector_count = 0
+        self._vector_cache_dirty = False
+        self._lookup_vector = functools.lru_cache(maxsize=VECTOR_LRU_SIZE)(self._extract_one)
 
     def load_model(self):
         """Load spaCy model with word vectors."""
         self.log(f"📦 Loading spaCy model: {self.model_name}")
         try:
-            self.nlp = spacy.load(self.model_name)
+            self.nlp = spacy.load(self.model_name, exclude=UNUSED_PIPES)
         except OSError:
             print(f"❌ Model '{self.model_name}' not found.")
             print(f"   Install it with: python -m spacy download {self.model_name}")
@@ -155,95 +231,416 @@ class SemanticPoleEngine:
         self.log(f"   ✅ {len(self.poles)} poles, {len(self.special_words)} special words")
         return self
 
-    def get_vector(self, word):
-        """Get word vector using the pipeline (not just vocab lookup)."""
-        if word in self._vector_cache:
-            return self._vector_cache[word]
+    def _model_key(self):
+        """
+        Model name plus installed version, read without loading the model, so
+        upgrading the model package invalidates everything cached from it.
+        """
+        try:
+            version = importlib.metadata.version(self.model_name)
+        except importlib.metadata.PackageNotFoundError:
+            meta_path = Path(self.model_name) / "meta.json"
+            version = "unknown"
+            if meta_path.exists():
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    version = json.load(f).get("version", version)
+        return f"{self.model_name}=={version}"
+
+    def _cache_path(self, kind, key):
+        """Disk cache file for `kind`, keyed by a content hash of `key`."""
+        digest = hashlib.sha256(f"{CACHE_VERSION}:{key}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{kind}-{digest[:16]}.npz"
+
+    @staticmethod
+    def _save_npz(path, **arrays):
+        """Write an .npz atomically, so an interrupted run can't leave a truncated cache."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file per writer, so concurrent runs never share one
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.stem + "-",
+                                         suffix=".tmp", delete=False) as f:
+            try:
+                np.savez(f, **arrays)
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, path)
+
+    def load_vector_cache(self):
+        """
+        Load word vectors extracted on previous runs for this model, so only
+        new words need spaCy (and the model is not loaded at all if none do).
+        """
+        if self.cache_dir is None:
+            return self
+
+        path = self._cache_path("vectors", self._model_key())
+        if not path.exists():
+            return self
+
+        with np.load(path) as data:
+            words = data["words"].tolist()
+            vectors = data["vectors"]
+            norms = data["norms"]
+            missing = data["missing"].tolist()
+
+        new = [i for i, w in enumerate(words) if w not in self._vector_index]
+        if new:
+            start = self._vector_count
+            self._reserve_vectors(len(new), vectors.shape[1])
+            self._vector_store[start:start + len(new)] = vectors[new]
+            self._vector_norms[start:start + len(new)] = norms[new]
+            self._vector_index.update((words[i], start + k) for k, i in enumerate(new))
+            self._vector_count += len(new)
+        for word in missing:
+            self._vector_index.setdefault(word, -1)
+
+        self.log(f"♻️  {len(self._vector_index):,} cached word vectors: {path}")
+        return self
+
+    def save_vector_cache(self):
+        """Persist the vector cache if this run extracted anything new."""
+        if self.cache_dir is None or not self._vector_cache_dirty:
+            return self
+
+        words = [""] * self._vector_count
+        missing = []
+        for word, row in self._vector_index.items():
+            if row >= 0:
+                words[row] = word
+            else:
+                missing.append(word)
+        if self._vector_store is not None:
+            vectors = self._vector_store[:self._vector_count]
+            norms = self._vector_norms[:self._vector_count]
+        else:
+            vectors = np.zeros((0, 0), dtype=np.float32)
+            norms = np.zeros(0, dtype=np.float32)
+
+        path = self._cache_path("vectors", self._model_key())
+        self._save_npz(path, words=np.array(words, dtype=str), vectors=vectors, norms=norms,
+                       missing=np.array(sorted(missing), dtype=str))
+        self._vector_cache_dirty = False
+        self.log(f"💾 Vector cache saved: {path}")
+        return self
+
+    def _pole_cache_path(self):
+        key = self._model_key() + json.dumps(self.poles, sort_keys=True, ensure_ascii=False)
+        return self._cache_path("poles", key)
+
+    def extract_vectors(self, words):
+        """
+        Fill the vector cache for all uncached words. Words in the model's
+        vector table are read straight from the vocab; only the rest go
+        through a single nlp.pipe() pass.
+        """
+        pending = [w for w in dict.fromkeys(words) if w not in self._vector_index]
+        if not pending:
+            return self
+        if self.nlp is None:
+            self.load_model()
+
+        self._vector_cache_dirty = True
+        vocab = self.nlp.vocab
+        oov = []
+        for word in pending:
+            if vocab.has_vector(word):
+                vec = vocab.get_vector(word)
+                self._store_vector(word, vec if np.vdot(vec, vec) > 0 else None)
+            else:
+                oov.append(word)
+
+        if self.verbose and len(pending) > 1:
+            self.log(f"   {len(pending) - len(oov):,} vectors from vocab, "
+                     f"{len(oov):,} through the pipeline")
+
+        scratch = np.empty(vocab.vectors_length, dtype=np.float32)
+        for word, doc in zip(oov, self.nlp.pipe(oov, batch_size=PIPE_BATCH_SIZE)):
+            if self._doc_vector(doc, scratch) and np.vdot(scratch, scratch) > 0:
+                self._store_vector(word, scratch)
+            else:
+                self._store_vector(word, None)
+
+        return self
+
+    @staticmethod
+    def _doc_vector(doc, out):
+        """
+        Write the mean of `doc`'s token vectors into `out` (same value as
+        Doc.vector, OOV tokens counting as zeros); False if no token has one.
+        Unlike Doc.vector this allocates nothing on the OOV path.
+        """
+        if len(doc) == 1:
+            if not doc[0].has_vector:
+                return False
+            out[:] = doc[0].vector
+            return True
+
+        found = False
+        out.fill(0.0)
+        for token in doc:
+            if token.has_vector:
+                np.add(out, token.vector, out=out)
+                found = True
+        if found:
+            out *= 1.0 / len(doc)
+        return found
+
+    def _reserve_vectors(self, n_rows, dim):
+        """Make room for `n_rows` more vectors, growing the store in whole chunks."""
+        needed = self._vector_count + n_rows
+        capacity = -(-needed // VECTOR_STORE_CHUNK) * VECTOR_STORE_CHUNK
+        if self._vector_store is None:
+            self._vector_store = np.empty((capacity, dim), dtype=np.float32)
+            self._vector_norms = np.empty(capacity, dtype=np.float32)
+        elif needed > len(self._vector_store):
+            grown = np.empty((capacity, self._vector_store.shape[1]), dtype=np.float32)
+            grown[:self._vector_count] = self._vector_store[:self._vector_count]
+            self._vector_store = grown
+            grown_norms = np.empty(capacity, dtype=np.float32)
+            grown_norms[:self._vector_count] = self._vector_norms[:self._vector_count]
+            self._vector_norms = grown_norms
+
+    def _store_vector(self, word, vec):
+        """
+        Copy `vec` into the next store row, normalized so scoring is a plain
+        dot product (None marks `word` as vector-less).
+        """
+        if vec is None:
+            self._vector_index[word] = -1
+            return
+        self._reserve_vectors(1, len(vec))
+        row = self._vector_store[self._vector_count]
+        row[:] = vec
+        norm = np.sqrt(np.vdot(row, row))
+        row *= 1.0 / norm
+        self._vector_norms[self._vector_count] = norm
+        self._vector_index[word] = self._vector_count
+        self._vector_count += 1
+
+    def _extract_one(self, word):
+        """Vector for a single word, looked up without touching the store."""
+        if self.nlp is None:
+            self.load_model()
+
+        vocab = self.nlp.vocab
+        if vocab.has_vector(word):
+            vec = vocab.get_vector(word).astype(np.float32, copy=False)
+        else:
+            vec = np.empty(vocab.vectors_length, dtype=np.float32)
+            if not self._doc_vector(self.nlp(word), vec):
+                return None
 
-        doc = self.nlp(word)
-        if doc.has_vector and np.linalg.norm(doc.vector) > 0:
-            vec = doc.vector.copy()
-            self._vector_cache[word] = vec
-            return vec
+        norm_sq = np.vdot(vec, vec)
+        return vec / np.sqrt(norm_sq) if norm_sq > 0 else None
 
-        self._vector_cache[word] = None
-        return None
+    def get_vector(self, word):
+        """
+        Get a word's L2-normalized vector: from the store if it was extracted
+        in bulk, otherwise through a bounded LRU so ad-hoc lookups (--test,
+        library use on user input) don't grow the store without limit.
+        """
+        row = self._vector_index.get(word)
+        if row is not None:
+            return self._vector_store[row] if row >= 0 else None
+        return self._lookup_vector(word)
 
     def compute_pole_centroids(self):
         """
         Compute centroid vector for each pole from its seed words.
-        The centroid is the average of all valid seed word vectors.
+        The centroid is the L2-normalized average of all valid seed word vectors.
         """
         self.log("🧭 Computing pole centroids...")
-        for pole_name, pole_data in self.poles.items():
-            seeds = pole_data.get("seeds", [])
-            vectors = []
-            missing = []
-
-            for seed in seeds:
-                vec = self.get_vector(seed)
-                if vec is not None:
-                    vectors.append(vec)
+        pole_cache = self._pole_cache_path() if self.cache_dir is not None else None
+        if pole_cache is not None and pole_cache.exists():
+            with np.load(pole_cache) as data:
+                centroids = data["centroids"].astype(np.float32, copy=False)
+                self.pole_vectors = dict(zip(data["names"].tolist(), centroids))
+            self.log(f"   ♻️  {len(self.pole_vectors)} centroids loaded from cache")
+        else:
+            # Extract every seed of every pole in one batch up front
+            self.extract_vectors(
+                seed for pole_data in self.poles.values()
+                for seed in pole_data.get("seeds", [])
+            )
+
+            for pole_name, pole_data in self.poles.items():
+                seeds = pole_data.get("seeds", [])
+                rows = [self._vector_index[seed] for seed in seeds]
+                valid = [row for row in rows if row >= 0]
+                missing = [seed for seed, row in zip(seeds, rows) if row < 0]
+
+                if valid:
+                    # Average the original (un-normalized) seed vectors
+                    seed_vectors = self._vector_store[valid] * self._vector_norms[valid, None]
+                    self.pole_vectors[pole_name] = seed_vectors.mean(axis=0)
+                    self.log(f"   {pole_data.get('emoji', '•')} {pole_name}: "
+                             f"{len(valid)}/{len(seeds)} seeds valid")
+                    if missing and self.verbose:
+                        self.log(f"      Missing: {', '.join(missing)}")
                 else:
-                    missing.append(seed)
-
-            if vectors:
-                centroid = np.mean(vectors, axis=0)
-                norm = np.linalg.norm(centroid)
-                if norm > 0:
-                    centroid = centroid / norm
-                self.pole_vectors[pole_name] = centroid
-                self.log(f"   {pole_data.get('emoji', '•')} {pole_name}: "
-                         f"{len(vectors)}/{len(seeds)} seeds valid")
-                if missing and self.verbose:
-                    self.log(f"      Missing: {', '.join(missing)}")
-            else:
-                print(f"   ⚠️  {pole_name}: No valid seed vectors! Skipping.")
+                    print(f"   ⚠️  {pole_name}: No valid seed vectors! Skipping.")
+
+            if pole_cache is not None and self.pole_vectors:
+                self._save_npz(pole_cache, names=np.array(list(self.pole_vectors), dtype=str),
+                               centroids=np.stack(list(self.pole_vectors.values())))
+
+        # One contiguous, row-normalized (P, D) matrix for the scoring GEMM;
+        # pole_vectors keeps per-pole views into its rows.
+        self._pole_names = list(self.pole_vectors)
+        if self._pole_names:
+            P = np.ascontiguousarray(np.stack(
+                [self.pole_vectors[name] for name in self._pole_names], dtype=np.float32
+            ))
+            norms = np.linalg.norm(P, axis=1, keepdims=True)
+            np.divide(P, norms, out=P, where=norms > 0)
+            self._pole_matrix = P
+            self.pole_vectors = dict(zip(self._pole_names, P))
+
+        # Affinities are rescaled from [threshold, 1] to [0, 1]: multiply by
+        # the precomputed reciprocal instead of dividing per element.
+        self._inv_span = 1.0 / (1.0 - self.config.get("similarity_threshold", 0.35))
+
+        self._param_names = list(dict.fromkeys(
+            param for pole_data in self.poles.values()
+            for param in pole_data.get("affects", {})
+        ))
+        param_index = {param: j for j, param in enumerate(self._param_names)}
+        self._affects_matrix = np.zeros((len(self._pole_names), len(self._param_names)))
+        # Columns each pole touches, in the order its "affects" lists them
+        self._affects_columns = []
+        for i, pole_name in enumerate(self._pole_names):
+            columns = []
+            for param, weight in self.poles[pole_name].get("affects", {}).items():
+                self._affects_matrix[i, param_index[param]] = weight
+                columns.append(param_index[param])
+            self._affects_columns.append(columns)
 
         return self
 
+    def compute_affinity_matrix(self, words, backend=None):
+        """
+        Score many words against every pole in one batched kernel (SimSIMD
+        cosine when installed, else a single (N, D) @ (D, P) matmul).
+        `backend` picks one of SCORING_BACKENDS explicitly.
+        Returns (words_with_vectors, scaled, mask, effects): scaled[i, j] is the
+        rescaled affinity of word i to pole j, mask[i, j] whether it reached the
+        threshold, and effects[i] the word's row of compute_effects_matrix().
+        """
+        self.extract_vectors(words)
+        rows = [self._vector_index[w] for w in words]
+        words = [w for w, row in zip(words, rows) if row >= 0]
+        rows = [row for row in rows if row >= 0]
+        if not words:
+            shape = (0, len(self._pole_names))
+            return (words, np.zeros(shape), np.zeros(shape, dtype=bool),
+                    np.zeros((0, len(self._param_names))))
+
+        # One gather from the vector store into a contiguous (N, D) buffer
+        scaled, mask, effects = self._score(self._vector_store[rows], backend)
+        return words, scaled, mask, effects
+
+    def compare_backends(self, words):
+        """
+        Score `words` with every optional backend and count the affinity,
+        mask and effect values that differ from the NumPy path. Returns
+        {backend: differing_values}; empty if no word has a vector.
+        """
+        _, *reference = self.compute_affinity_matrix(words, backend="numpy")
+        if not len(reference[0]):
+            return {}
+
+        diffs = {}
+        for backend in SCORING_BACKENDS:
+            if backend == "numpy":
+                continue
+            _, *result = self.compute_affinity_matrix(words, backend=backend)
+            diffs[backend] = sum(
+                int(np.count_nonzero(a != b)) for a, b in zip(result, reference)
+            )
+        return diffs
+
+    def _score(self, W, backend=None):
+        """
+        Rescaled pole affinities, threshold mask and environmental effects for
+        the (N, D) float32 word matrix W, whose rows are already unit-length.
+        `backend` is one of SCORING_BACKENDS (default: the first available);
+        they agree up to float32 rounding of the similarities.
+        """
+        backend = backend or SCORING_BACKENDS[0]
+        # float32 scalars, so every backend compares and rescales in float32
+        threshold = np.float32(self.config.get("similarity_threshold", 0.35))
+        inv_span = np.float32(self._inv_span)
+        shape = (len(W), len(self._pole_names))
+        # simsimd.cdist rejects empty collections; answer those before dispatch
+        if self._pole_matrix is None or len(W) == 0:
+            return (np.zeros(shape), np.zeros(shape, dtype=bool),
+                    np.zeros((len(W), len(self._param_names))))
+
+        if backend == "simsimd":
+            distance = simsimd.cdist(W, self._pole_matrix, metric="cosine")
+            similarity = 1.0 - np.asarray(distance, dtype=np.float32)
+        else:
+            similarity = W @ self._pole_matrix.T
+
+        mask = similarity >= threshold
+        scaled = np.empty(similarity.shape)  # float64, like the effects matrix
+        np.clip((similarity - threshold) * inv_span, 0.0, 1.0, out=scaled)
+        np.round(scaled, 3, out=scaled)
+        effects = self.compute_effects_matrix(np.where(mask, scaled, 0.0))
+        return scaled, mask, effects
+
+    def _affinity_dict(self, scaled_row, mask_row):
+        """Materialize one row of the affinity matrix as {pole_name: score}."""
+        return {
+            name: float(value)
+            for name, value, hit in zip(self._pole_names, scaled_row, mask_row)
+            if hit
+        }
+
     def compute_word_affinities(self, word):
         """
         Compute a word's affinity to each semantic pole.
         Returns dict of {pole_name: similarity_score} for scores above threshold.
         """
-        word_vec = self.get_vector(word)
-        if word_vec is None:
-            return None
-
-        word_norm = np.linalg.norm(word_vec)
-        if word_norm == 0:
+        vec = self.get_vector(word)
+        if vec is None:
             return None
 
-        word_vec_normalized = word_vec / word_norm
-        threshold = self.config.get("similarity_threshold", 0.35)
-        affinities = {}
+        scaled, mask, _ = self._score(vec[np.newaxis, :])
+        affinities = self._affinity_dict(scaled[0], mask[0])
+        return affinities if affinities else None
 
-        for pole_name, centroid in self.pole_vectors.items():
-            similarity = float(np.dot(word_vec_normalized, centroid))
-            if similarity >= threshold:
-                scaled = (similarity - threshold) / (1.0 - threshold)
-                affinities[pole_name] = round(min(scaled, 1.0), 3)
+    def compute_effects_matrix(self, affinities):
+        """
+        Convert an (N, P) affinity matrix into an (N, K) matrix of environmental
+        parameter changes, columns ordered as _param_names.
+        """
+        effects = np.clip(affinities @ self._affects_matrix, -1.0, 1.0)
+        np.round(effects, 3, out=effects)
+        return effects
 
-        return affinities if affinities else None
+    def _effects_dict(self, effects_row, mask_row):
+        """
+        Materialize one row of the effects matrix as {param: value}, with every
+        parameter of every pole that hit — including ones that sum to 0.0 — in
+        the order those poles list them.
+        """
+        columns = dict.fromkeys(
+            j for i in np.flatnonzero(mask_row) for j in self._affects_columns[i]
+        )
+        return {self._param_names[j]: float(effects_row[j]) for j in columns}
 
     def compute_environmental_effects(self, affinities):
         """
         Convert pole affinities into concrete environmental parameter changes.
         """
-        effects = {}
-        for pole_name, strength in affinities.items():
-            pole_data = self.poles.get(pole_name, {})
-            pole_affects = pole_data.get("affects", {})
-            for param, weight in pole_affects.items():
-                if param not in effects:
-                    effects[param] = 0.0
-                effects[param] += weight * strength
-
-        for param in effects:
-            effects[param] = round(max(-1.0, min(1.0, effects[param])), 3)
+        row = np.zeros((1, len(self._pole_names)))
+        for i, pole_name in enumerate(self._pole_names):
+            row[0, i] = affinities.get(pole_name, 0.0)
+        hit = np.array([name in affinities for name in self._pole_names], dtype=bool)
 
-        return effects
+        return self._effects_dict(self.compute_effects_matrix(row)[0], hit)
 
     def generate_dictionary(self, extra_words=None):
         """
@@ -251,44 +648,36 @@ class SemanticPoleEngine:
         """
         self.log(f"🔍 Building dictionary from curated word list...")
 
-        candidates = set()
-
-        # Curated words
-        for w in CURATED_WORDS:
-            w = w.strip().lower()
-            if len(w) >= 2:
-                candidates.add(w)
-
         # Extra words from --words flag
-        if extra_words:
-            for w in extra_words:
-                w = w.strip().lower()
-                if len(w) >= 2:
-                    candidates.add(w)
+        extra = (w.strip().lower() for w in extra_words or ())
 
-        # External wordlist file
+        # External wordlist file (single words only)
+        listed = ()
         if DEFAULT_WORDLIST_PATH.exists():
             self.log(f"   📂 Loading external wordlist: {DEFAULT_WORDLIST_PATH}")
-            with open(DEFAULT_WORDLIST_PATH, "r", encoding="utf-8") as f:
-                for line in f:
-                    w = line.strip().lower()
-                    if len(w) >= 2 and w.isalpha():
-                        candidates.add(w)
+            lines = DEFAULT_WORDLIST_PATH.read_text(encoding="utf-8").splitlines()
+            listed = (w for w in (line.strip().lower() for line in lines) if w.isalpha())
+
+        candidates = {
+            w for w in itertools.chain(CURATED_WORDS, extra, listed) if len(w) >= 2
+        }
 
         self.log(f"   📝 {len(candidates):,} candidate words")
 
         dictionary = {}
         word_count = 0
-        no_vector = 0
         no_affinity = 0
         start_time = time.time()
 
-        for word in sorted(candidates):
-            affinities = self.compute_word_affinities(word)
-            if affinities is None:
-                no_vector += 1
+        words, scaled, mask, effects_matrix = self.compute_affinity_matrix(list(candidates))
+        no_vector = len(candidates) - len(words)
+
+        for i, word in enumerate(words):
+            affinities = self._affinity_dict(scaled[i], mask[i])
+            if not affinities:
+                no_affinity += 1
                 continue
-            effects = self.compute_environmental_effects(affinities)
+            effects = self._effects_dict(effects_matrix[i], mask[i])
             if effects:
                 dictionary[word] = {
                     "poles": affinities,
@@ -327,7 +716,7 @@ class SemanticPoleEngine:
                 "model": self.model_name
             },
             "poles": pole_meta,
-            "words": dictionary
+            "words": dict(sorted(dictionary.items()))  # only mapped words get sorted
         }
 
         return output
@@ -366,6 +755,8 @@ Examples:
                         help="Comma-separated list of words to add")
     parser.add_argument("--test", action="store_true",
                         help="Test mode: check poles, show sample mappings")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Don't read or write the vector cache in {DEFAULT_CACHE_DIR}")
     parser.add_argument("-v", "--verbose", action="store_true",
                         help="Verbose output")
 
@@ -378,13 +769,16 @@ Examples:
     print("=" * 50)
     print()
 
-    engine = SemanticPoleEngine(model_name=args.model, verbose=args.verbose)
-    engine.load_model()
+    cache_dir = None if args.no_cache else DEFAULT_CACHE_DIR
+    engine = SemanticPoleEngine(model_name=args.model, verbose=args.verbose,
+                                cache_dir=cache_dir)
+    engine.load_vector_cache()
     engine.load_poles(args.poles)
     engine.compute_pole_centroids()
 
     if args.test:
         run_tests(engine)
+        engine.save_vector_cache()
         return
 
     extra_words = args.words.split(",") if args.words else None
@@ -398,6 +792,7 @@ Examples:
         existing_words = {}
 
     dictionary = engine.generate_dictionary(extra_words=extra_words)
+    engine.save_vector_cache()
 
     if args.extend:
         existing_words.update(dictionary)
@@ -408,15 +803,13 @@ Examples:
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    write_json(output_path, output)
     print(f"\n💾 Dictionary saved: {output_path}")
     print(f"   {len(dictionary):,} words → {output_path.stat().st_size / 1024:.1f} KB")
 
     # Write special words separately
     special_output = output_path.parent / "special_words.json"
-    with open(special_output, "w", encoding="utf-8") as f:
-        json.dump(engine.special_words, f, ensure_ascii=False, indent=2)
+    write_json(special_output, engine.special_words)
     print(f"💾 Special words saved: {special_output}")
     print(f"   {len(engine.special_words)} special words")
 
@@ -473,6 +866,21 @@ def run_tests(engine):
         else:
             print(f"  ❌ {word:14s} │ (no affinity)")
 
+    # Optional scoring backends against the NumPy path
+    print(f"\n{'─' * 60}")
+    print(f"Scoring backends ({', '.join(SCORING_BACKENDS)}):")
+    if len(SCORING_BACKENDS) == 1:
+        print("  (no optional backend installed)")
+    else:
+        diffs = engine.compare_backends(test_words)
+        if not diffs:
+            print("  (no test word has a vector)")
+        for backend, count in diffs.items():
+            if count == 0:
+                print(f"  ✅ {backend:14s} │ identical to numpy")
+            else:
+                print(f"  ⚠️  {backend:14s} │ {count} values differ from numpy")
+
     # Special words
     print(f"\n{'─' * 60}")
     print(f"Special words ({len(engine.special_words)}):")